@@ -0,0 +1,233 @@
+"""
+query_masker(mask_query / unmask_query) 성능 벤치마크.
+
+합성 코퍼스(sql_corpus)를 크기별로 만들어 mask, unmask, 라운드트립의
+처리량·지연 백분위·최대 메모리를 측정하고, 매 반복마다
+unmask(mask(q)) == q 를 검사한다.
+
+사용 예:
+    python -m benchmarks.bench_masker                       # 1K ~ 1M
+    python -m benchmarks.bench_masker --sizes 1K,10K,100K   # 빠른 확인
+    python -m benchmarks.bench_masker --sizes 10M           # 대용량 (1회 수 분 소요)
+    python -m benchmarks.bench_masker --save-baseline       # 기준값 저장
+    python -m benchmarks.bench_masker --compare             # 기준값 대비 회귀 검사
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import platform
+import argparse
+import tracemalloc
+from datetime import datetime
+
+from query_masker import mask_query, unmask_query
+from benchmarks.sql_corpus import generate_sql, parse_size, format_size
+
+BASELINE_DIR = os.path.join(os.path.dirname(__file__), "baselines")
+DEFAULT_BASELINE = os.path.join(BASELINE_DIR, "masker.json")
+DEFAULT_SIZES = "1K,10K,100K,1M"
+OPS = ("mask", "unmask", "roundtrip")
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """최근접 순위(nearest-rank) 방식 백분위: ceil(pct/100 * n) 번째 값."""
+    if not sorted_values:
+        return 0.0
+    rank = min(max(1, math.ceil(pct / 100 * len(sorted_values))), len(sorted_values))
+    return sorted_values[rank - 1]
+
+
+def _summarize(samples: list[float], nbytes: int, peak: int) -> dict:
+    values = sorted(samples)
+    p50 = percentile(values, 50)
+    return {
+        "runs": len(values),
+        "p50_ms": p50 * 1000,
+        "p90_ms": percentile(values, 90) * 1000,
+        "p99_ms": percentile(values, 99) * 1000,
+        "max_ms": values[-1] * 1000,
+        "mb_per_s": (nbytes / 1024 ** 2) / p50 if p50 else 0.0,
+        "peak_kb": peak / 1024,
+    }
+
+
+def _measure_peak(sql: str) -> tuple[int, int]:
+    """mask / unmask 각각의 최대 할당 메모리(바이트). 시간 측정과 분리해 1회만 수행."""
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        masked, mapping = mask_query(sql)
+        mask_peak = tracemalloc.get_traced_memory()[1] - base
+
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        unmask_query(masked, mapping)
+        unmask_peak = tracemalloc.get_traced_memory()[1] - base
+    finally:
+        tracemalloc.stop()
+    return mask_peak, unmask_peak
+
+
+def run_case(sql: str, repeat: int, budget: float) -> tuple[dict, list[str]]:
+    """
+    한 코퍼스에 대해 mask / unmask / 라운드트립을 측정한다.
+
+    반복 횟수는 첫 회 소요 시간 기준으로 budget(초) 안에 들도록 조정하되
+    최소 3회, 최대 repeat 회. 첫 회만으로 budget을 넘으면 1회로 끝낸다.
+
+    Returns:
+        (연산별 요약, 라운드트립 실패 메시지 목록)
+    """
+    nbytes = len(sql.encode("utf-8"))
+    samples = {op: [] for op in OPS}
+    failures = []
+
+    runs = repeat
+    i = 0
+    while i < runs:
+        t0 = time.perf_counter()
+        masked, mapping = mask_query(sql)
+        t1 = time.perf_counter()
+        restored = unmask_query(masked, mapping)
+        t2 = time.perf_counter()
+
+        samples["mask"].append(t1 - t0)
+        samples["unmask"].append(t2 - t1)
+        samples["roundtrip"].append(t2 - t0)
+
+        # 라운드트립 오라클: unmask(mask(q)) == q
+        if restored != sql and not failures:
+            pos = next((k for k, (a, b) in enumerate(zip(restored, sql)) if a != b),
+                       min(len(restored), len(sql)))
+            failures.append(
+                f"unmask(mask(q)) != q (첫 차이 위치 {pos}: "
+                f"{sql[pos:pos + 40]!r} -> {restored[pos:pos + 40]!r})"
+            )
+
+        if i == 0:
+            if t2 - t0 > budget:
+                runs = 1
+            else:
+                runs = max(3, min(repeat, int(budget / max(t2 - t0, 1e-9))))
+        i += 1
+
+    mask_peak, unmask_peak = _measure_peak(sql)
+    peaks = {"mask": mask_peak, "unmask": unmask_peak, "roundtrip": max(mask_peak, unmask_peak)}
+    return {op: _summarize(samples[op], nbytes, peaks[op]) for op in OPS}, failures
+
+
+def run_suite(sizes: list[int], corpus_args: dict, repeat: int, budget: float) -> dict:
+    results = {
+        "meta": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "corpus": corpus_args,
+        },
+        "cases": {},
+        "failures": [],
+    }
+    for size in sizes:
+        sql = generate_sql(size, **corpus_args)
+        label = format_size(size)
+        summary, failures = run_case(sql, repeat, budget)
+        for op, stats in summary.items():
+            stats["bytes"] = len(sql.encode("utf-8"))
+            results["cases"][f"{op}@{label}"] = stats
+        results["failures"].extend(f"[{label}] {msg}" for msg in failures)
+        _print_size(label, summary, failures)
+    return results
+
+
+def _print_size(label: str, summary: dict, failures: list[str]):
+    for op, s in summary.items():
+        print(
+            f"{label:>6} {op:<10} runs={s['runs']:<4} "
+            f"p50={s['p50_ms']:10.2f}ms p90={s['p90_ms']:10.2f}ms p99={s['p99_ms']:10.2f}ms "
+            f"{s['mb_per_s']:8.2f}MB/s peak={s['peak_kb']:10.1f}KB"
+        )
+    for msg in failures:
+        print(f"{label:>6} FAIL       {msg}")
+    sys.stdout.flush()
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list[str]:
+    """baseline 대비 p50 지연 또는 최대 메모리가 tolerance 비율 이상 늘어난 항목 목록."""
+    regressions = []
+    for key, base in baseline.get("cases", {}).items():
+        cur = current["cases"].get(key)
+        if cur is None:
+            continue
+        for metric in ("p50_ms", "peak_kb"):
+            if base[metric] and cur[metric] > base[metric] * (1 + tolerance):
+                regressions.append(
+                    f"{key} {metric}: {base[metric]:.2f} -> {cur[metric]:.2f} "
+                    f"(+{(cur[metric] / base[metric] - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="query_masker 벤치마크")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help=f"쉼표로 구분한 크기 목록 (기본 {DEFAULT_SIZES})")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--identifiers", type=int, default=50, help="컬럼 식별자 풀 크기")
+    parser.add_argument("--depth", type=int, default=2, help="서브쿼리 / PL/SQL 블록 중첩 깊이")
+    parser.add_argument("--literal-density", type=float, default=0.7,
+                        help="비교·대입 값이 컬럼 참조가 아닌 리터럴일 확률")
+    parser.add_argument("--string-literal-ratio", type=float, default=0.3,
+                        help="리터럴 중 문자열 리터럴 비율")
+    parser.add_argument("--comment-density", type=float, default=0.2)
+    parser.add_argument("--dotted-paths", type=int, default=16, help="SCHEMA.TABLE 경로 개수")
+    parser.add_argument("--repeat", type=int, default=50, help="크기별 최대 반복 횟수")
+    parser.add_argument("--budget", type=float, default=2.0, help="크기별 목표 측정 시간(초)")
+    parser.add_argument("--save-baseline", nargs="?", const=DEFAULT_BASELINE, metavar="PATH")
+    parser.add_argument("--compare", nargs="?", const=DEFAULT_BASELINE, metavar="PATH")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="회귀 판정 허용 비율 (기본 0.25)")
+    args = parser.parse_args(argv)
+
+    corpus_args = {
+        "seed": args.seed,
+        "identifiers": args.identifiers,
+        "depth": args.depth,
+        "literal_density": args.literal_density,
+        "string_literal_ratio": args.string_literal_ratio,
+        "comment_density": args.comment_density,
+        "dotted_paths": args.dotted_paths,
+    }
+    sizes = [parse_size(s) for s in args.sizes.split(",") if s.strip()]
+    results = run_suite(sizes, corpus_args, args.repeat, args.budget)
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save_baseline)), exist_ok=True)
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        print(f"기준값 저장: {args.save_baseline}")
+
+    status = 0
+    if results["failures"]:
+        status = 1
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline["meta"].get("corpus") != corpus_args:
+            print("경고: 기준값과 코퍼스 파라미터가 다릅니다.")
+        regressions = compare(results, baseline, args.tolerance)
+        for msg in regressions:
+            print(f"REGRESSION {msg}")
+        if regressions:
+            status = 1
+        else:
+            print(f"회귀 없음 (허용 {args.tolerance * 100:.0f}%)")
+
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+"""
+main.py 기동 성능 벤치마크.
+
+매 회 새 프로세스에서 측정한다.
+  - import: `import main` 소요 시간
+  - first_response: uvicorn 프로세스 생성부터 `GET /` 첫 200 응답까지
+
+정렬한 측정값의 p50(최근접 순위, 홀수 회면 정확히 가운데 값)이
+예산(budget)을 넘으면 종료 코드 1. 판정에 쓴 값과 전체 측정값을 함께 출력한다.
+
+사용 예:
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --runs 9 --import-budget 600
+"""
+
+import os
+import sys
+import math
+import time
+import socket
+import argparse
+import subprocess
+import urllib.request
+
+from benchmarks.bench_masker import percentile
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 기동 예산 (ms, p50 기준)
+IMPORT_BUDGET_MS = 600
+FIRST_RESPONSE_BUDGET_MS = 1200
+
+_IMPORT_SNIPPET = (
+    "import time; t = time.perf_counter(); import main; "
+    "print((time.perf_counter() - t) * 1000)"
+)
+
+
+def measure_import() -> float:
+    out = subprocess.run(
+        [sys.executable, "-c", _IMPORT_SNIPPET],
+        cwd=ROOT_DIR, capture_output=True, text=True, check=True,
+    )
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def measure_first_response(timeout: float = 30.0) -> float:
+    port = _free_port()
+    url = f"http://127.0.0.1:{port}/"
+    t0 = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1",
+         "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+    )
+    try:
+        while time.perf_counter() - t0 < timeout:
+            if proc.poll() is not None:
+                raise RuntimeError(f"서버가 종료되었습니다: {proc.stderr.read().decode(errors='replace')}")
+            try:
+                with urllib.request.urlopen(url, timeout=1) as resp:
+                    if resp.status == 200:
+                        return (time.perf_counter() - t0) * 1000
+            except OSError:
+                time.sleep(0.005)
+        raise TimeoutError(f"{timeout}초 안에 응답이 없습니다.")
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="main.py 기동 벤치마크")
+    parser.add_argument("--runs", type=int, default=5, help="측정 횟수 (홀수 권장)")
+    parser.add_argument("--import-budget", type=float, default=IMPORT_BUDGET_MS, help="ms")
+    parser.add_argument("--first-response-budget", type=float, default=FIRST_RESPONSE_BUDGET_MS, help="ms")
+    args = parser.parse_args(argv)
+
+    results = {
+        "import": (sorted(measure_import() for _ in range(args.runs)), args.import_budget),
+        "first_response": (sorted(measure_first_response() for _ in range(args.runs)), args.first_response_budget),
+    }
+
+    status = 0
+    for name, (values, budget) in results.items():
+        p50 = percentile(values, 50)
+        rank = max(1, math.ceil(len(values) / 2))
+        ok = p50 <= budget
+        print(
+            f"{name:<15} p50={p50:8.1f}ms ({rank}/{len(values)}번째) "
+            f"{'<=' if ok else '>'} budget={budget:.0f}ms {'OK' if ok else 'OVER'}"
+        )
+        print(f"{'':<15} 측정값(ms): {', '.join(f'{v:.1f}' for v in values)}")
+        if not ok:
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,223 @@
+"""
+마스킹 엔진 벤치마크용 Oracle SQL / PL/SQL 합성 코퍼스 생성 모듈.
+같은 seed와 파라미터면 항상 같은 텍스트를 만든다.
+"""
+
+import re
+import random
+import itertools
+
+from query_masker import SQL_KEYWORDS
+
+# 식별자 조립용 음절 (사내 테이블/컬럼명 느낌)
+_WORDS = [
+    "CUST", "ORD", "ITEM", "PROD", "EMP", "DEPT", "ACCT", "TRX", "INV",
+    "PAY", "ADDR", "CODE", "STAT", "HIST", "REQ", "RSLT", "USR", "GRP",
+    "AMT", "QTY", "PRC", "DT", "NM", "NO", "SEQ", "YN", "TP", "CD",
+]
+_SCHEMA_WORDS = ["HR", "FIN", "SALES", "MES", "ERP", "CRM", "SCM", "DW"]
+_TEXT_WORDS = [
+    "alpha", "beta", "gamma", "delta", "test", "sample", "value", "seoul",
+    "busan", "ready", "done", "error", "check", "temp", "batch",
+]
+
+# 마스킹 결과 별칭과 겹치면 라운드트립이 깨지므로 생성 대상에서 제외
+_ALIAS_LIKE = re.compile(r"^(SCH|TBL|COL|ALS)_\d+$")
+
+# 무작위 이름 생성 재시도 한도
+_MAX_ATTEMPTS = 20
+
+
+def parse_size(text: str) -> int:
+    """'1K', '10MB', '2048' 같은 크기 표기를 바이트 수로 변환."""
+    m = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([KMG]?)B?\s*", text.upper())
+    if not m:
+        raise ValueError(f"잘못된 크기 표기입니다: {text}")
+    unit = {"": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}[m.group(2)]
+    return int(float(m.group(1)) * unit)
+
+
+def format_size(n: int) -> str:
+    """바이트 수를 '1K', '10M' 형태로 표기."""
+    for unit, div in (("M", 1024 ** 2), ("K", 1024)):
+        if n >= div and n % div == 0:
+            return f"{n // div}{unit}"
+    return str(n)
+
+
+class _Pool:
+    """코퍼스 전체에서 재사용하는 스키마·테이블·컬럼 식별자 풀."""
+
+    def __init__(self, rng: random.Random, identifiers: int, dotted_paths: int):
+        used = set()
+        serial = itertools.count(1)
+
+        def _make(words, parts):
+            # 조합 공간이 작아 풀이 크면 중복만 나오므로, 몇 번 실패하면 일련번호를 붙인다
+            for attempt in itertools.count():
+                name = "_".join(rng.choice(words) for _ in range(parts))
+                if attempt >= _MAX_ATTEMPTS:
+                    name += f"_{next(serial)}"
+                elif rng.random() < 0.3:
+                    name += str(rng.randint(1, 99))
+                if (name not in used and name.upper() not in SQL_KEYWORDS
+                        and not _ALIAS_LIKE.match(name)):
+                    used.add(name)
+                    return name
+
+        n_schemas = max(1, dotted_paths // 8)
+        self.schemas = [_make(_SCHEMA_WORDS, 1) + "_OWN" for _ in range(n_schemas)]
+        self.tables = [
+            (rng.choice(self.schemas), "TB_" + _make(_WORDS, 2))
+            for _ in range(max(1, dotted_paths))
+        ]
+        self.columns = [_make(_WORDS, rng.randint(1, 3)) for _ in range(max(1, identifiers))]
+        self.variables = ["v_" + _make(_WORDS, 1).lower() for _ in range(max(1, identifiers // 10))]
+
+
+class _Generator:
+    def __init__(self, seed, identifiers, depth, literal_density,
+                 string_literal_ratio, comment_density, dotted_paths):
+        self.rng = random.Random(seed)
+        self.pool = _Pool(self.rng, identifiers, dotted_paths)
+        self.depth = depth
+        self.literal_density = literal_density
+        self.string_literal_ratio = string_literal_ratio
+        self.comment_density = comment_density
+        self._alias_no = 0
+
+    # ─── 조각 ─────────────────────────────────────────────
+    def _table_alias(self) -> str:
+        self._alias_no += 1
+        return f"t{self._alias_no}"
+
+    def _table(self) -> str:
+        schema, table = self.rng.choice(self.pool.tables)
+        return f"{schema}.{table}"
+
+    def _column(self) -> str:
+        return self.rng.choice(self.pool.columns)
+
+    def _value(self, alias: str) -> str:
+        """비교·대입 값. literal_density 확률로 리터럴, 아니면 컬럼 참조."""
+        if self.rng.random() >= self.literal_density:
+            return f"{alias}.{self._column()}"
+        if self.rng.random() < self.string_literal_ratio:
+            words = " ".join(self.rng.choice(_TEXT_WORDS) for _ in range(self.rng.randint(1, 3)))
+            return f"'{words}'"
+        return str(self.rng.randint(0, 99999))
+
+    def _comment(self, indent: str) -> str:
+        if self.rng.random() >= self.comment_density:
+            return ""
+        # 주석 안에도 식별자가 섞이도록 컬럼명을 일부 넣는다
+        words = [self.rng.choice(_TEXT_WORDS + self.pool.columns) for _ in range(self.rng.randint(2, 6))]
+        if self.rng.random() < 0.5:
+            return f"{indent}-- {' '.join(words)}\n"
+        return f"{indent}/* {' '.join(words)} */\n"
+
+    def _predicate(self, alias: str, depth: int, indent: str) -> str:
+        roll = self.rng.random()
+        if depth > 0 and roll < 0.25:
+            sub = self.select(depth - 1, indent + "    ")
+            return f"{alias}.{self._column()} IN (\n{sub}\n{indent})"
+        if roll < 0.4:
+            return f"{alias}.{self._column()} BETWEEN {self._value(alias)} AND {self._value(alias)}"
+        if roll < 0.5:
+            return f"NVL({alias}.{self._column()}, {self._value(alias)}) = {self._value(alias)}"
+        return f"{alias}.{self._column()} = {self._value(alias)}"
+
+    # ─── 문장 ─────────────────────────────────────────────
+    def select(self, depth: int, indent: str = "") -> str:
+        a1 = self._table_alias()
+        aliases = [a1]
+        cols = ", ".join(
+            f"{self.rng.choice(aliases)}.{self._column()}" for _ in range(self.rng.randint(2, 6))
+        )
+        lines = [self._comment(indent) + f"{indent}SELECT {cols}",
+                 f"{indent}  FROM {self._table()} {a1}"]
+        for _ in range(self.rng.randint(0, 2)):
+            a2 = self._table_alias()
+            col = self._column()
+            lines.append(f"{indent}  JOIN {self._table()} {a2} ON {a2}.{col} = {a1}.{col}")
+            aliases.append(a2)
+        preds = [self._predicate(self.rng.choice(aliases), depth, indent + "   ")
+                 for _ in range(self.rng.randint(1, 4))]
+        lines.append(f"{indent} WHERE " + f"\n{indent}   AND ".join(preds))
+        if self.rng.random() < 0.3:
+            lines.append(f"{indent} ORDER BY {a1}.{self._column()} DESC")
+        return "\n".join(lines)
+
+    def update(self, indent: str = "") -> str:
+        a1 = self._table_alias()
+        sets = ", ".join(f"{a1}.{self._column()} = {self._value(a1)}" for _ in range(self.rng.randint(1, 3)))
+        return (self._comment(indent)
+                + f"{indent}UPDATE {self._table()} {a1}\n"
+                + f"{indent}   SET {sets}\n"
+                + f"{indent} WHERE {self._predicate(a1, 0, indent)}")
+
+    def plsql_block(self, depth: int, indent: str = "") -> str:
+        var = self.rng.choice(self.pool.variables)
+        inner = indent + "    "
+        body = []
+        for _ in range(self.rng.randint(1, 3)):
+            roll = self.rng.random()
+            if depth > 0 and roll < 0.3:
+                body.append(self.plsql_block(depth - 1, inner))
+            elif roll < 0.6:
+                cursor = self.select(max(0, depth - 1), inner + "    ")
+                body.append(
+                    f"{inner}FOR r IN (\n{cursor}\n{inner}) LOOP\n"
+                    f"{inner}    {var} := r.{self._column()};\n"
+                    f"{inner}END LOOP;"
+                )
+            else:
+                body.append(self.update(inner) + ";")
+        return (
+            self._comment(indent)
+            + f"{indent}DECLARE\n{inner}{var} VARCHAR2(100);\n{indent}BEGIN\n"
+            + "\n".join(body)
+            + f"\n{indent}EXCEPTION\n{inner}WHEN OTHERS THEN\n{inner}    NULL;\n{indent}END;"
+        )
+
+    def statement(self) -> str:
+        # 테이블 alias(t1, t2 ...)는 문장마다 새로 매긴다
+        self._alias_no = 0
+        roll = self.rng.random()
+        if roll < 0.5:
+            return self.select(self.depth) + ";"
+        if roll < 0.7:
+            return self.update() + ";"
+        return self.plsql_block(self.depth) + "\n/"
+
+
+def generate_sql(
+    target_bytes: int,
+    seed: int = 0,
+    identifiers: int = 50,
+    depth: int = 2,
+    literal_density: float = 0.7,
+    string_literal_ratio: float = 0.3,
+    comment_density: float = 0.2,
+    dotted_paths: int = 16,
+) -> str:
+    """
+    target_bytes 크기(UTF-8 기준, 마지막 문장 단위로 잘라 근사)의 합성 SQL을 생성한다.
+
+    Args:
+        identifiers: 컬럼 식별자 풀 크기
+        depth: 서브쿼리 / PL/SQL 블록 중첩 깊이
+        literal_density: 비교·대입 값이 (컬럼 참조가 아닌) 리터럴일 확률 (0~1)
+        string_literal_ratio: 리터럴 중 문자열 리터럴의 비율 (나머지는 숫자, 0~1)
+        comment_density: 문장·절 앞에 주석이 붙을 확률 (0~1)
+        dotted_paths: SCHEMA.TABLE 형태 경로 개수
+    """
+    gen = _Generator(seed, identifiers, depth, literal_density, string_literal_ratio,
+                     comment_density, dotted_paths)
+    chunks = []
+    size = 0
+    while size < target_bytes:
+        stmt = gen.statement() + "\n\n"
+        chunks.append(stmt)
+        size += len(stmt.encode("utf-8"))
+    return "".join(chunks)
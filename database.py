@@ -12,21 +12,30 @@ def get_conn():
     return conn
 
 
+# 스키마가 바뀌면 올린다. DB의 PRAGMA user_version 과 같으면 스키마 검사를 건너뛴다.
+SCHEMA_VERSION = 1
+
+
 def init_db():
     conn = get_conn()
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS query_history (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            original_query TEXT NOT NULL,
-            encrypted_query TEXT NOT NULL,
-            mapping TEXT NOT NULL,
-            restored_query TEXT,
-            created_at TEXT NOT NULL,
-            restored_at TEXT
-        )
-    """)
-    conn.commit()
-    conn.close()
+    try:
+        if conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION:
+            return
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS query_history (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                original_query TEXT NOT NULL,
+                encrypted_query TEXT NOT NULL,
+                mapping TEXT NOT NULL,
+                restored_query TEXT,
+                created_at TEXT NOT NULL,
+                restored_at TEXT
+            )
+        """)
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.commit()
+    finally:
+        conn.close()
 
 
 def save_encryption(original: str, encrypted: str, mapping: dict) -> int:
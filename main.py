@@ -1,25 +1,59 @@
-from fastapi import FastAPI, HTTPException, Request, Form, UploadFile, File
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Request, Form, UploadFile, File, WebSocket, WebSocketDisconnect
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
 from pydantic import BaseModel
 import os
+import json
 
 from database import init_db, save_encryption, save_restoration, get_history_list, get_history_detail
-from query_masker import mask_query, unmask_query
-from project_manager import (
-    load_projects, add_project, delete_project,
-    sync_project, sync_project_from_file,
-    load_proxy, save_proxy,
-)
-
-app = FastAPI(title="Work Helper")
+from query_masker import mask_query, unmask_query, StreamUnmasker
 
 BASE_DIR = os.path.dirname(__file__)
-app.mount("/static", StaticFiles(directory=os.path.join(BASE_DIR, "static")), name="static")
-templates = Jinja2Templates(directory=os.path.join(BASE_DIR, "templates"))
+TEMPLATE_DIR = os.path.join(BASE_DIR, "templates")
+TEMPLATE_CACHE_DIR = os.path.join(BASE_DIR, ".jinja_cache")
+
+
+def _bytecode_cache() -> FileSystemBytecodeCache | None:
+    """템플릿 바이트코드 디스크 캐시. 캐시 폴더를 만들 수 없으면 캐시 없이 동작한다."""
+    try:
+        os.makedirs(TEMPLATE_CACHE_DIR, exist_ok=True)
+    except OSError:
+        return None
+    return FileSystemBytecodeCache(TEMPLATE_CACHE_DIR)
+
+
+# 컴파일된 템플릿 바이트코드를 디스크에 캐시해 재시작 시 파싱을 건너뛴다
+templates = Jinja2Templates(env=Environment(
+    loader=FileSystemLoader(TEMPLATE_DIR),
+    autoescape=True,
+    bytecode_cache=_bytecode_cache(),
+))
+
+
+def _precompile_templates():
+    """첫 요청 지연을 없애기 위해 모든 템플릿을 미리 컴파일해 둔다."""
+    for name in templates.env.list_templates(extensions=["html"]):
+        templates.env.get_template(name)
+
+
+def _git_sync():
+    """Git 동기화 모듈(project_manager)은 첫 사용 시에 불러온다."""
+    import project_manager
+    return project_manager
 
-init_db()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    init_db()
+    _precompile_templates()
+    yield
+
+
+app = FastAPI(title="Work Helper", lifespan=lifespan)
+app.mount("/static", StaticFiles(directory=os.path.join(BASE_DIR, "static")), name="static")
 
 
 # ─── 대시보드 ───────────────────────────────────────────────
@@ -100,6 +134,48 @@ async def decrypt_query(request: Request, modified_query: str = Form(...), histo
     })
 
 
+@app.websocket("/query-mask/decrypt/stream/{history_id}")
+async def decrypt_query_stream(websocket: WebSocket, history_id: int):
+    """
+    스트리밍 중인 LLM 출력을 조각 단위로 받아 즉시 복원해 돌려준다.
+
+    수신: {"chunk": "..."} 반복, 끝나면 {"done": true}
+    송신: {"restored": "..."} (별칭 일부일 수 있는 끝부분만 보류),
+          종료 시 {"restored": "...", "done": true}
+    done 을 받으면 전체 복원 결과를 이력에 저장한다.
+    """
+    await websocket.accept()
+    detail = get_history_detail(history_id)
+    if not detail:
+        await websocket.send_json({"error": "해당 이력을 찾을 수 없습니다."})
+        await websocket.close(code=1008)
+        return
+
+    unmasker = StreamUnmasker(detail["mapping"])
+    try:
+        while True:
+            try:
+                message = json.loads(await websocket.receive_text())
+            except (KeyError, ValueError):  # 바이너리 프레임(KeyError) 또는 JSON 아님
+                message = None
+            if not isinstance(message, dict) or not isinstance(message.get("chunk", ""), str):
+                await websocket.send_json({"error": '메시지는 {"chunk": "..."} 또는 {"done": true} 형식이어야 합니다.'})
+                await websocket.close(code=1003)
+                return
+            if message.get("chunk"):
+                restored = unmasker.feed(message["chunk"])
+                if restored:
+                    await websocket.send_json({"restored": restored})
+            if message.get("done"):
+                tail = unmasker.close()
+                save_restoration(history_id, unmasker.restored)
+                await websocket.send_json({"restored": tail, "done": True})
+                await websocket.close()
+                return
+    except WebSocketDisconnect:
+        pass  # done 없이 끊긴 스트림은 일부만 복원된 것이므로 기존 이력을 덮어쓰지 않는다
+
+
 # ─── 이력 ───────────────────────────────────────────────────
 @app.get("/query-mask/history", response_class=HTMLResponse)
 async def history_list(request: Request):
@@ -127,7 +203,7 @@ async def git_sync_page(request: Request):
 
 @app.get("/api/projects")
 async def get_projects_api():
-    projects = load_projects()
+    projects = _git_sync().load_projects()
     return [
         {"id": key, "name": val["name"], "repo_url": val["repo_url"], "target": val["target_folder"]}
         for key, val in projects.items()
@@ -137,7 +213,7 @@ async def get_projects_api():
 @app.post("/api/projects")
 async def add_project_api(project: ProjectCreate):
     try:
-        add_project(project.id, project.name, project.repo_url, project.target_folder, project.token)
+        _git_sync().add_project(project.id, project.name, project.repo_url, project.target_folder, project.token)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     return {"message": f"'{project.name}' 프로젝트가 추가되었습니다."}
@@ -146,7 +222,7 @@ async def add_project_api(project: ProjectCreate):
 @app.delete("/api/projects/{project_id}")
 async def delete_project_api(project_id: str):
     try:
-        delete_project(project_id)
+        _git_sync().delete_project(project_id)
     except KeyError as e:
         raise HTTPException(status_code=404, detail=str(e))
     return {"message": "프로젝트가 삭제되었습니다."}
@@ -155,7 +231,7 @@ async def delete_project_api(project_id: str):
 @app.post("/api/update/{project_id}")
 async def update_project_api(project_id: str):
     try:
-        msg = sync_project(project_id)
+        msg = _git_sync().sync_project(project_id)
     except KeyError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -169,7 +245,7 @@ async def upload_sync_api(project_id: str, zip_file: UploadFile = File(...)):
         raise HTTPException(status_code=400, detail="ZIP 파일만 업로드 가능합니다.")
     try:
         file_bytes = await zip_file.read()
-        msg = sync_project_from_file(project_id, file_bytes)
+        msg = _git_sync().sync_project_from_file(project_id, file_bytes)
     except KeyError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -180,13 +256,13 @@ async def upload_sync_api(project_id: str, zip_file: UploadFile = File(...)):
 # ─── 프록시 설정 ──────────────────────────────────────────
 @app.get("/api/proxy")
 async def get_proxy_api():
-    return load_proxy()
+    return _git_sync().load_proxy()
 
 
 @app.post("/api/proxy")
 async def set_proxy_api(request: Request):
     body = await request.json()
-    save_proxy(body.get("http", ""), body.get("https", ""))
+    _git_sync().save_proxy(body.get("http", ""), body.get("https", ""))
     return {"message": "프록시 설정이 저장되었습니다."}
 
 
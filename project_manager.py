@@ -7,7 +7,6 @@ import os
 import json
 import shutil
 import filecmp
-import requests
 from datetime import datetime
 
 BASE_DIR = os.path.dirname(__file__)
@@ -183,6 +182,9 @@ def sync_project(project_id: str) -> str:
 
     temp_zip = os.path.join(BASE_DIR, f"temp_{project_id}.zip")
 
+    # requests 는 import 비용이 커서 실제 다운로드할 때만 불러온다
+    import requests
+
     try:
         headers = {"Authorization": f"token {token}"} if token else {}
         proxies = _get_proxies()
@@ -231,3 +231,91 @@ def unmask_query(masked_sql: str, mapping: dict) -> str:
     for alias, original in sorted((k, mapping[k]) for k in sorted_aliases):
         result = re.sub(r'\b' + re.escape(alias) + r'\b', original, result)
     return result
+
+
+def _is_word_char(ch: str) -> bool:
+    """정규식 \\w 와 같은 기준의 단어 문자 여부."""
+    return ch.isalnum() or ch == "_"
+
+
+class StreamUnmasker:
+    """
+    조각(chunk) 단위로 들어오는 LLM 출력을 즉시 복원하는 증분 복원기.
+
+    별칭이 조각 경계에서 잘릴 수 있으므로, 끝부분의 단어가 어떤 별칭의
+    접두어일 때만 그 단어를 다음 조각까지 보류한다. 따라서 조각당 처리량은
+    조각 크기(+ 최장 별칭 길이)에만 비례한다.
+
+    사용:
+        su = StreamUnmasker(mapping)
+        out = su.feed(chunk)   # 복원된 텍스트 (보류분 제외)
+        out = su.close()       # 보류분까지 모두 방출
+        su.restored            # 지금까지 방출한 전체 복원 텍스트
+    """
+
+    def __init__(self, mapping: dict):
+        self.mapping = mapping
+        aliases = sorted(mapping.keys(), key=lambda x: -len(x))
+        # unmask_query 와 같은 단어 경계 조건. 조각 사이 문맥은 lookbehind 로 이어 본다.
+        self._pattern = re.compile(
+            r'(?<!\w)(?:' + "|".join(re.escape(a) for a in aliases) + r')(?!\w)'
+        ) if aliases else None
+        self._prefixes = {a[:i] for a in aliases for i in range(1, len(a) + 1)}
+        self._max_len = max((len(a) for a in aliases), default=0)
+        self._tail = ""
+        self._prev = ""  # 직전에 방출한 마지막 글자 (단어 경계 판단용)
+        self._parts = []
+        self.closed = False
+
+    @property
+    def restored(self) -> str:
+        return "".join(self._parts)
+
+    def _hold_length(self, buf: str) -> int:
+        """buf 끝에서 보류해야 하는 글자 수."""
+        n = 0
+        # 최장 별칭보다 긴 단어는 별칭이 될 수 없으므로 그 이상은 보지 않는다
+        while n <= self._max_len and n < len(buf) and _is_word_char(buf[-1 - n]):
+            n += 1
+        if n == 0 or n > self._max_len:
+            return 0
+        if n == len(buf) and self._prev and _is_word_char(self._prev):
+            return 0  # 이미 방출한 단어의 연속이므로 별칭 시작이 아님
+        return n if buf[-n:] in self._prefixes else 0
+
+    def _emit(self, text: str) -> str:
+        if not text:
+            return ""
+        if self._pattern is None:
+            out = text
+        else:
+            src = self._prev + text
+            pieces = []
+            last = len(self._prev)
+            for m in self._pattern.finditer(src, len(self._prev)):
+                pieces.append(src[last:m.start()])
+                pieces.append(self.mapping[m.group(0)])
+                last = m.end()
+            pieces.append(src[last:])
+            out = "".join(pieces)
+        self._prev = text[-1]
+        self._parts.append(out)
+        return out
+
+    def feed(self, chunk: str) -> str:
+        """조각을 받아 지금 확정할 수 있는 복원 텍스트를 반환한다."""
+        if self.closed:
+            raise ValueError("이미 종료된 스트림입니다.")
+        buf = self._tail + chunk
+        cut = len(buf) - self._hold_length(buf)
+        self._tail = buf[cut:]
+        return self._emit(buf[:cut])
+
+    def close(self) -> str:
+        """보류 중인 끝부분을 방출하고 스트림을 종료한다."""
+        if self.closed:
+            return ""
+        out = self._emit(self._tail)
+        self._tail = ""
+        self.closed = True
+        return out
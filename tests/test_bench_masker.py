@@ -0,0 +1,21 @@
+import pytest
+
+from benchmarks.bench_masker import percentile
+
+
+@pytest.mark.parametrize("n, p50, p90", [
+    (1, 1, 1),
+    (5, 3, 5),
+    (9, 5, 9),
+    (10, 5, 9),
+    (13, 7, 12),
+])
+def test_percentile_nearest_rank(n, p50, p90):
+    values = list(range(1, n + 1))
+    assert percentile(values, 50) == p50
+    assert percentile(values, 90) == p90
+    assert percentile(values, 100) == n
+
+
+def test_percentile_empty():
+    assert percentile([], 50) == 0.0
@@ -0,0 +1,116 @@
+import os
+import sys
+import sqlite3
+import subprocess
+
+import pytest
+from fastapi.testclient import TestClient
+
+import database
+import main
+from query_masker import mask_query
+
+SQL = "SELECT u.NAME FROM HR.TB_USER u WHERE u.ID = 1"
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(database, "DB_PATH", str(tmp_path / "test.db"))
+    with TestClient(main.app) as c:
+        yield c
+
+
+@pytest.fixture
+def history_id(client):
+    masked, mapping = mask_query(SQL)
+    return database.save_encryption(SQL, masked, mapping), masked
+
+
+def _drain(ws):
+    out = []
+    while True:
+        msg = ws.receive_json()
+        out.append(msg["restored"])
+        if msg.get("done"):
+            return "".join(out)
+
+
+def test_stream_decrypt_restores_and_saves(client, history_id):
+    hid, masked = history_id
+    with client.websocket_connect(f"/query-mask/decrypt/stream/{hid}") as ws:
+        for i in range(0, len(masked), 5):
+            ws.send_json({"chunk": masked[i:i + 5]})
+        ws.send_json({"done": True})
+        assert _drain(ws) == SQL
+    assert database.get_history_detail(hid)["restored_query"] == SQL
+
+
+def test_stream_disconnect_keeps_previous_restoration(client, history_id):
+    hid, masked = history_id
+    database.save_restoration(hid, SQL)
+    with client.websocket_connect(f"/query-mask/decrypt/stream/{hid}") as ws:
+        ws.send_json({"chunk": masked[:10]})
+    assert database.get_history_detail(hid)["restored_query"] == SQL
+
+
+@pytest.mark.parametrize("frame", ['["x"]', '{"chunk": 3}', "not json"])
+def test_stream_rejects_malformed_frames(client, history_id, frame):
+    hid, _ = history_id
+    with client.websocket_connect(f"/query-mask/decrypt/stream/{hid}") as ws:
+        ws.send_text(frame)
+        assert "error" in ws.receive_json()
+
+
+def test_stream_unknown_history(client):
+    with client.websocket_connect("/query-mask/decrypt/stream/999999") as ws:
+        assert ws.receive_json() == {"error": "해당 이력을 찾을 수 없습니다."}
+
+
+def test_bytecode_cache_creates_directory(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "jinja"
+    monkeypatch.setattr(main, "TEMPLATE_CACHE_DIR", str(cache_dir))
+    assert main._bytecode_cache() is not None
+    assert cache_dir.is_dir()
+
+
+def test_serves_without_lifespan(tmp_path, monkeypatch):
+    monkeypatch.setattr(database, "DB_PATH", str(tmp_path / "test.db"))
+    database.init_db()
+    c = TestClient(main.app)  # with 없이: lifespan 미실행
+    assert c.get("/").status_code == 200
+    assert c.get("/query-mask/history").status_code == 200
+
+
+def test_import_does_not_load_git_sync():
+    code = "import sys, main; print('project_manager' in sys.modules, 'requests' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], cwd=main.BASE_DIR or ".",
+                         capture_output=True, text=True, check=True)
+    assert out.stdout.split() == ["False", "False"]
+
+
+def test_init_db_skips_schema_when_version_matches(tmp_path, monkeypatch):
+    db_path = str(tmp_path / "test.db")
+    monkeypatch.setattr(database, "DB_PATH", db_path)
+    database.init_db()
+
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == database.SCHEMA_VERSION
+    conn.execute("DROP TABLE query_history")
+    conn.commit()
+    conn.close()
+
+    database.init_db()
+    conn = sqlite3.connect(db_path)
+    tables = conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall()
+    conn.close()
+    assert ("query_history",) not in tables
+
+
+def test_lifespan_precompiles_all_templates(tmp_path, monkeypatch):
+    monkeypatch.setattr(database, "DB_PATH", str(tmp_path / "test.db"))
+    env = main.templates.env
+    env.cache.clear()
+    expected = {f for f in os.listdir(main.TEMPLATE_DIR) if f.endswith(".html")}
+    with TestClient(main.app):
+        cached = {name for _, name in env.cache.keys()}
+    assert expected <= cached
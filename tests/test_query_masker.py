@@ -0,0 +1,31 @@
+import pytest
+
+from query_masker import mask_query, unmask_query
+from benchmarks.sql_corpus import generate_sql
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+@pytest.mark.parametrize("size", [1024, 16 * 1024])
+def test_round_trip(seed, size):
+    sql = generate_sql(size, seed=seed)
+    masked, mapping = mask_query(sql)
+    assert masked != sql
+    assert unmask_query(masked, mapping) == sql
+
+
+def test_round_trip_with_options():
+    sql = generate_sql(8 * 1024, seed=3, identifiers=300, depth=4, literal_density=1.0,
+                       comment_density=0.8, dotted_paths=64)
+    masked, mapping = mask_query(sql)
+    assert unmask_query(masked, mapping) == sql
+
+
+def test_corpus_is_deterministic():
+    assert generate_sql(4096, seed=7) == generate_sql(4096, seed=7)
+    assert generate_sql(4096, seed=7) != generate_sql(4096, seed=8)
+
+
+def test_corpus_large_identifier_pool():
+    # 조합 공간보다 큰 풀도 생성되어야 한다
+    sql = generate_sql(1024, identifiers=30000, dotted_paths=7000)
+    assert len(sql) >= 1024
@@ -0,0 +1,75 @@
+import random
+
+import pytest
+
+from query_masker import mask_query, unmask_query, StreamUnmasker
+from benchmarks.sql_corpus import generate_sql
+
+MAPPING = {"COL_001": "EMP_NAME", "COL_0012": "DEPT_NO", "TBL_001": "TB_EMP"}
+
+
+def _stream(mapping, chunks):
+    su = StreamUnmasker(mapping)
+    out = [su.feed(c) for c in chunks]
+    out.append(su.close())
+    return out, su
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_random_chunks_match_unmask_query(seed):
+    rng = random.Random(seed)
+    masked, mapping = mask_query(generate_sql(4096, seed=seed))
+    # LLM 이 덧붙인 단어·한글이 별칭 앞뒤에 붙는 경우도 섞는다
+    text = masked.replace(" = ", " = xCOL_001 ").replace("\n\n", "\n한글COL_002 COL_00 \n")
+    chunks = []
+    i = 0
+    while i < len(text):
+        k = rng.randint(1, 12)
+        chunks.append(text[i:i + k])
+        i += k
+    out, su = _stream(mapping, chunks)
+    assert "".join(out) == su.restored == unmask_query(text, mapping)
+
+
+def test_alias_split_across_chunks_is_held():
+    su = StreamUnmasker(MAPPING)
+    assert su.feed("SELECT COL_0") == "SELECT "
+    assert su.feed("01 FROM TBL_") == "EMP_NAME FROM "
+    assert su.feed("001;") == "TB_EMP;"
+
+
+def test_longer_alias_wins_across_chunks():
+    out, _ = _stream(MAPPING, ["COL_001", "2 x"])
+    assert "".join(out) == "DEPT_NO x"
+
+
+def test_word_continuing_across_boundary_is_not_replaced():
+    out, _ = _stream(MAPPING, ["x = ABC", "COL_001 + COL_001", "X"])
+    assert "".join(out) == "x = ABCCOL_001 + COL_001X"
+    assert "".join(out) == unmask_query("x = ABCCOL_001 + COL_001X", MAPPING)
+
+
+def test_non_ascii_neighbour():
+    text = "가COL_001 (COL_001)한 COL_001"
+    out, _ = _stream(MAPPING, list(text))
+    assert "".join(out) == unmask_query(text, MAPPING) == "가COL_001 (EMP_NAME)한 EMP_NAME"
+
+
+def test_close_flushes_held_tail():
+    su = StreamUnmasker(MAPPING)
+    assert su.feed("WHERE COL_001") == "WHERE "
+    assert su.close() == "EMP_NAME"
+    assert su.restored == "WHERE EMP_NAME"
+    assert su.close() == ""
+
+
+def test_feed_after_close_raises():
+    su = StreamUnmasker(MAPPING)
+    su.close()
+    with pytest.raises(ValueError):
+        su.feed("x")
+
+
+def test_empty_mapping_passes_through():
+    out, _ = _stream({}, ["SELECT ", "COL_001"])
+    assert "".join(out) == "SELECT COL_001"